@@ -467,12 +467,68 @@ impl Collection {
         Ok(())
     }
 
+    /// Merges two JSON values, with `new_value` taking precedence over `existing_value`.
+    ///
+    /// For objects, this performs a deep merge where fields from `new_value` override
+    /// or add to fields in `existing_value`. For other types, `new_value` completely replaces
+    /// `existing_value`.
+    #[allow(
+        clippy::pattern_type_mismatch,
+        reason = "false positive with serde_json::Value"
+    )]
+    fn merge_json_values(existing_value: &Value, new_value: Value) -> Value {
+        match (existing_value, &new_value) {
+            (Value::Object(existing_map), Value::Object(new_map)) => {
+                let mut merged = existing_map.clone();
+                for (key, value) in new_map {
+                    if let Some(existing_val) = merged.get(key) {
+                        merged.insert(
+                            key.clone(),
+                            Self::merge_json_values(existing_val, value.clone()),
+                        );
+                    }
+                    else {
+                        merged.insert(key.clone(), value.clone());
+                    }
+                }
+                Value::Object(merged)
+            },
+            _ => new_value,
+        }
+    }
+
+    /// Returns whether `doc` already carries the signature this collection would write for it.
+    ///
+    /// Without a signing key the collection never signs, so whatever is stored is kept. With a
+    /// signing key the stored signature must verify against that key's public key, so documents
+    /// that are unsigned or signed by a previous key are not considered current.
+    async fn has_current_signature(&self, doc: &Document) -> Result<bool> {
+        let Some(key) = self.signing_key.as_ref()
+        else {
+            return Ok(true);
+        };
+        if doc.signature().is_empty() {
+            return Ok(false);
+        }
+        let public_key = key.verifying_key();
+        let is_valid = sentinel_crypto::verify_signature(doc.hash(), doc.signature(), &public_key).await?;
+        Ok(is_valid)
+    }
+
     /// Updates a document by merging new data with existing data.
     ///
     /// This method loads the existing document, merges the provided data with the existing
     /// document data (deep merge for objects), updates the metadata (updated_at timestamp),
     /// and saves the document back to disk.
     ///
+    /// An update whose merged data equals the stored data is a no-op: no WAL entry is written,
+    /// the file is not rewritten, and `updated_at`, `hash` and `signature` are left unchanged.
+    /// In a collection without a signing key this also means an existing signature is kept
+    /// rather than cleared. In a collection with a signing key the no-op only applies when the
+    /// stored signature verifies against that key; an unsigned document is rewritten so the
+    /// update signs it. A document signed by a different key is rejected when it is loaded, with
+    /// `SentinelError::SignatureVerificationFailed`, just like any other update.
+    ///
     /// If the document doesn't exist, this method will return an error.
     ///
     /// # Arguments
@@ -508,36 +564,6 @@ impl Collection {
     /// # Ok(())
     /// # }
     /// ```
-    /// Merges two JSON values, with `new_value` taking precedence over `existing_value`.
-    ///
-    /// For objects, this performs a deep merge where fields from `new_value` override
-    /// or add to fields in `existing_value`. For other types, `new_value` completely replaces
-    /// `existing_value`.
-    #[allow(
-        clippy::pattern_type_mismatch,
-        reason = "false positive with serde_json::Value"
-    )]
-    fn merge_json_values(existing_value: &Value, new_value: Value) -> Value {
-        match (existing_value, &new_value) {
-            (Value::Object(existing_map), Value::Object(new_map)) => {
-                let mut merged = existing_map.clone();
-                for (key, value) in new_map {
-                    if let Some(existing_val) = merged.get(key) {
-                        merged.insert(
-                            key.clone(),
-                            Self::merge_json_values(existing_val, value.clone()),
-                        );
-                    }
-                    else {
-                        merged.insert(key.clone(), value.clone());
-                    }
-                }
-                Value::Object(merged)
-            },
-            _ => new_value,
-        }
-    }
-
     pub async fn update(&self, id: &str, data: Value) -> Result<()> {
         trace!("Updating document with id: {}", id);
         Self::validate_document_id(id)?;
@@ -554,6 +580,15 @@ impl Collection {
         // Merge the new data with existing data
         let merged_data = Self::merge_json_values(existing_doc.data(), data);
 
+        // Nothing to do if the merge leaves the data untouched and the stored signature is current:
+        // skip WAL, hashing, signing and the file rewrite so idempotent updates stay cheap and keep
+        // the stored hash and timestamps. Documents that are unsigned or signed by another key in a
+        // signing collection still go through the full path so the update signs them.
+        if merged_data == existing_doc.data && self.has_current_signature(&existing_doc).await? {
+            debug!("Update for document {} is a no-op, skipping write", id);
+            return Ok(());
+        }
+
         // Write to WAL before filesystem operation
         if let Some(wal) = self.wal_manager.as_ref() &&
             !self
@@ -744,7 +779,7 @@ mod tests {
     use serde_json::json;
     use sentinel_wal::{CollectionWalConfigOverrides, StoreWalConfig};
 
-    use crate::{Collection, Store};
+    use crate::{Collection, SentinelError, Store};
 
     // ============ Document ID Validation Tests ============
 
@@ -1081,6 +1116,98 @@ mod tests {
                                                         // we provided full address object
     }
 
+    #[tokio::test]
+    async fn test_update_with_identical_data_is_noop() {
+        let temp_dir = tempdir().unwrap();
+        let store = Store::new(temp_dir.path().join("data"), None)
+            .await
+            .unwrap();
+        let collection = store.collection("test").await.unwrap();
+
+        collection
+            .insert("doc", json!({"name": "Alice", "age": 30}))
+            .await
+            .unwrap();
+        let before = collection.get("doc").await.unwrap().unwrap();
+        let file_path = collection.path.join("doc.json");
+        let bytes_before = tokio_fs::read(&file_path).await.unwrap();
+
+        // Partial payload whose merge matches the stored data
+        collection.update("doc", json!({"age": 30})).await.unwrap();
+
+        // The file must not have been rewritten (a rewrite would carry a new updated_at)
+        let bytes_after = tokio_fs::read(&file_path).await.unwrap();
+        assert_eq!(bytes_after, bytes_before);
+
+        let after = collection.get("doc").await.unwrap().unwrap();
+        assert_eq!(after.updated_at(), before.updated_at());
+        assert_eq!(after.data(), before.data());
+    }
+
+    #[tokio::test]
+    async fn test_update_with_identical_data_signs_unsigned_document() {
+        let temp_dir = tempdir().unwrap();
+        let mut store = Store::new(temp_dir.path().join("data"), None)
+            .await
+            .unwrap();
+        let collection = store.collection("test").await.unwrap();
+
+        // Written before any signing key was configured
+        collection
+            .insert("doc", json!({"name": "Alice", "age": 30}))
+            .await
+            .unwrap();
+        let before = collection.get("doc").await.unwrap().unwrap();
+        assert!(before.signature().is_empty());
+
+        store.set_signing_key(sentinel_crypto::SigningKeyManager::generate_key());
+        let signed_collection = store.collection("test").await.unwrap();
+
+        // Identical data must still go through the full path to sign the document
+        signed_collection
+            .update("doc", json!({"age": 30}))
+            .await
+            .unwrap();
+
+        let after = signed_collection.get("doc").await.unwrap().unwrap();
+        assert!(!after.signature().is_empty());
+        assert_eq!(after.data(), before.data());
+    }
+
+    #[tokio::test]
+    async fn test_update_with_identical_data_after_key_rotation() {
+        let temp_dir = tempdir().unwrap();
+        let mut store = Store::new(temp_dir.path().join("data"), None)
+            .await
+            .unwrap();
+
+        // Signed with key A
+        store.set_signing_key(sentinel_crypto::SigningKeyManager::generate_key());
+        let collection_a = store.collection("test").await.unwrap();
+        collection_a
+            .insert("doc", json!({"name": "Alice", "age": 30}))
+            .await
+            .unwrap();
+        let doc = collection_a.get("doc").await.unwrap().unwrap();
+        assert!(collection_a.has_current_signature(&doc).await.unwrap());
+
+        // Rotate to key B: the stored signature is no longer current, so no fast path
+        store.set_signing_key(sentinel_crypto::SigningKeyManager::generate_key());
+        let collection_b = store.collection("test").await.unwrap();
+        assert!(!collection_b.has_current_signature(&doc).await.unwrap());
+
+        // `update` loads through `get`, whose default strict signature check rejects the old
+        // signature before the merge, so the document is left untouched rather than kept as-is
+        let file_path = collection_b.path.join("doc.json");
+        let bytes_before = tokio_fs::read(&file_path).await.unwrap();
+        let result = collection_b.update("doc", json!({"age": 30})).await;
+        assert!(matches!(
+            result,
+            Err(SentinelError::SignatureVerificationFailed { .. })
+        ));
+        assert_eq!(tokio_fs::read(&file_path).await.unwrap(), bytes_before);
+    }
+
     // ============ Merge JSON Tests ============
 
     #[tokio::test]